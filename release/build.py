@@ -1,12 +1,14 @@
 import argparse
+import contextlib
 import hashlib
 import logging
+import os
 import re
 import shutil
-import subprocess
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
 
@@ -39,7 +41,11 @@ def build():
     parser = argparse.ArgumentParser()
     parser.add_argument("target")
     parser.add_argument("-o", "--out", default=str(working_dir / "build"))
-    parser.add_argument("--debug", action="store_true")
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Keep the temporary build directory for inspection",
+    )
     parser.add_argument("--zip", action="store_true")
     args = parser.parse_args()
 
@@ -52,40 +58,49 @@ def build():
     build_dir.mkdir(exist_ok=True)
 
     logger.info("Building bex binary")
-    bex_bin = _build_pyinstaller_dist(
+    bex_bin, bex_bin_sha_task = _build_pyinstaller_dist(
         build_dir, target, debug=args.debug, zipped=args.zip
     )
     logger.info("Bex binary built '%s'", str(bex_bin))
 
     logger.info("Generating sha256 for bex binary")
-    bex_bin_sha = _generate_sha256_file(bex_bin)
-    logger.info("SHA256 file generated '%s'", bex_bin_sha)
+    bex_bin_sha_task.result()
+    logger.info("SHA256 file generated '%s'", str(bex_bin.absolute()) + ".sha256")
 
 
 def _build_pyinstaller_dist(
     build_dir: Path, target: Target, *, debug: bool = False, zipped: bool = False
 ):
-    with tempfile.TemporaryDirectory(dir=build_dir if debug else None) as tmp_dir:
+    # NOTE: Keep the temporary directory on the same filesystem as the
+    #       output so moving the binary in place is an inode relink
+    #       instead of a byte copy. With --debug the directory (and the
+    #       PyInstaller work files in it) is kept for inspection.
+    tmp_dir = tempfile.mkdtemp(dir=build_dir)
+    try:
         _work_path = Path(tmp_dir) / "_build"
 
         # Build binary using pyinstaller
-        pyinstaller_bin = Path(shutil.which("pyinstaller"))  # type: ignore
+        # NOTE: Calling PyInstaller in-process skips one interpreter
+        #       startup and the 'pyinstaller' executable lookup.
+        from PyInstaller.__main__ import run as pyinstaller_run
+
         logger.info("Building binary with PyInstaller")
-        ret_code = subprocess.call(
-            [
-                str(pyinstaller_bin),
-                str(_PYINSTALLER_SPEC),
-                "--noconfirm",
-                "--distpath",
-                tmp_dir,
-                "--workpath",
-                _work_path,
-            ],
-            cwd=str(_ROOT_DIR),
-        )
-        if ret_code != 0:
-            msg = "Failed to build binary with pyinstaller"
-            raise RuntimeError(msg)
+        try:
+            with contextlib.chdir(_ROOT_DIR):
+                pyinstaller_run(
+                    [
+                        str(_PYINSTALLER_SPEC),
+                        "--noconfirm",
+                        "--distpath",
+                        tmp_dir,
+                        "--workpath",
+                        str(_work_path),
+                    ]
+                )
+        except SystemExit as exc:
+            if exc.code not in (0, None):
+                msg = "Failed to build binary with pyinstaller"
+                raise RuntimeError(msg) from exc
 
         _temp_binary_file = Path(tmp_dir) / f"bex{EXE}"
         _target = (
@@ -95,24 +110,47 @@ def _build_pyinstaller_dist(
         )
         if not zipped:
             _target_binary_file = build_dir / f"{_target}{EXE}"
-            if _target_binary_file.exists():
-                _target_binary_file.unlink()
-            shutil.move(_temp_binary_file, _target_binary_file)
+            os.replace(_temp_binary_file, _target_binary_file)
 
-            return _target_binary_file
+            return _target_binary_file, _start_sha256_task(_target_binary_file)
         else:
             _target_archive_name = build_dir / f"{_target}.zip"
             if _target_archive_name.exists():
                 _target_archive_name.unlink()
 
-            with zipfile.ZipFile(_target_archive_name, "w") as archive:
-                archive.write(_temp_binary_file, f"bex{EXE}")
+            with (
+                zipfile.ZipFile(
+                    _target_archive_name,
+                    "w",
+                    compression=zipfile.ZIP_STORED,
+                    allowZip64=True,
+                ) as archive,
+                archive.open(f"bex{EXE}", "w", force_zip64=True) as dst,
+                open(_temp_binary_file, "rb") as src,
+            ):
+                shutil.copyfileobj(src, dst, 1024 * 1024)
 
             _temp_binary_file.unlink()
-            return _target_archive_name
+            return _target_archive_name, _start_sha256_task(_target_archive_name)
+    finally:
+        if debug:
+            logger.info("Keeping build directory '%s'", tmp_dir)
+        else:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 # Utils
+def _start_sha256_task(path: Path) -> Future[str]:
+    # NOTE: hashlib releases the GIL, so the hashing pass overlaps with
+    #       the temporary-directory cleanup instead of running after it.
+    #       A future (unlike a bare thread) re-raises hashing failures
+    #       in result(), so a broken .sha256 still fails the build.
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(_generate_sha256_file, path)
+    executor.shutdown(wait=False)
+    return future
+
+
 def _parse_target(target: str) -> Target | None:
     _match = _TARGET_PATTERN.fullmatch(target)
     if _match is None:
@@ -129,8 +167,10 @@ def _parse_target(target: str) -> Target | None:
 
 def _generate_sha256_file(path: Path) -> str:
     _filename = str(path.absolute()) + ".sha256"
+    with open(path, "rb") as src:
+        digest = hashlib.file_digest(src, "sha256").hexdigest()
     with open(_filename, "w") as fp:
-        fp.write(hashlib.sha256(path.read_bytes()).hexdigest())
+        fp.write(digest)
     return _filename
 
 
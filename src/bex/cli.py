@@ -1,21 +1,13 @@
 from __future__ import annotations
 
-import hashlib
-import logging
+import argparse
+import contextlib
 import os
-import platform
-import re
-import signal
-import subprocess
 import sys
 from functools import partial
-from pathlib import Path  # noqa: TC003
-from typing import Annotated
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import typer
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.traceback import Traceback
 from stdlibx import result
 from stdlibx.cancel import (
     CancellationToken,
@@ -31,78 +23,193 @@ try:
 except Exception:
     __version__ = "unknown"
 
-from bex.config import Config, load_configuration
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rich.console import Console
+
+    from bex.config import Config
+
 from bex.errors import BexError, BexPyVenvError, BexUvError
-from bex.utils import wait_process
-from bex.uv import download_uv
 
-_ENTRYPOINT_PATTERN = re.compile(
-    r"(?P<module>[\w.]+)\s*"
-    r"(:\s*(?P<attr>[\w.]+)\s*)?"
-    r"((?P<extras>\[.*\])\s*)?$"
-)
+_IS_WINDOWS = sys.platform == "win32"
 
+_PY_VENV_BIN = ("Scripts", "python.exe") if _IS_WINDOWS else ("bin", "python")
 
-app = typer.Typer(
-    add_completion=False,
-    name="bex",
-    context_settings={
-        "allow_interspersed_args": False,
-        "help_option_names": ["-h", "--help"],
-    },
-)
+_LOGGING_CONFIGURED = False
 
 
-def main():
-    app(prog_name="bex")
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bex", allow_abbrev=False)
+    parser.add_argument(
+        "--version",
+        action="store_true",
+        help="Print version information (Python and bex version) and exit",
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        type=Path,
+        default=None,
+        help="Path to the configuration file",
+    )
+    parser.add_argument(
+        "-C",
+        "--directory",
+        type=Path,
+        default=None,
+        help="Directory used to resolve the configuration file",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        dest="verbosity",
+        action="count",
+        default=0,
+        help="Increase verbosity, can be repeated",
+    )
 
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.add_parser("init", help="Bootstrap the environment only (if needed)")
+    subparsers.add_parser(
+        "exec",
+        add_help=False,
+        help="Bootstrap the environment (if needed) and execute the entrypoint",
+    )
+    return parser
+
+
+def _option_takes_value(token: str) -> bool:
+    if token in ("--file", "--directory"):
+        return True
+    if len(token) < 2 or token[0] != "-" or token.startswith("--"):
+        return False
+
+    # NOTE: A short-option cluster ('-vf FILE') consumes the next token
+    #       only when the value-taking flag sits last with nothing
+    #       attached; '-fFILE' (or '-fC') carries its value inline.
+    for index, char in enumerate(token[1:], start=1):
+        if char in "fC":
+            return index == len(token) - 1
+    return False
+
+
+def _split_exec_args(argv: list[str]) -> tuple[list[str], list[str] | None]:
+    # NOTE: Everything after the 'exec' command belongs to the
+    #       entrypoint and must never reach argparse: REMAINDER stops
+    #       capturing when the first forwarded token looks like an
+    #       option, so 'bex exec --flag x' (or 'bex exec -h') would be
+    #       rejected instead of forwarded. Split the argv by hand,
+    #       skipping values of the options that take one.
+    index = 0
+    while index < len(argv):
+        token = argv[index]
+        if _option_takes_value(token):
+            index += 2
+            continue
+        if not token.startswith("-"):
+            if token == "exec":
+                return argv[: index + 1], argv[index + 1 :]
+            break
+        index += 1
+    return argv, None
+
+
+def _resolve_path_option(
+    parser: argparse.ArgumentParser,
+    option: str,
+    value: Path | None,
+    *,
+    dir_okay: bool,
+) -> Path | None:
+    if value is None:
+        return None
+
+    resolved = value.resolve()
+    if not resolved.exists():
+        parser.error(f"Invalid value for '{option}': '{value}' does not exist.")
+    if dir_okay and not resolved.is_dir():
+        parser.error(f"Invalid value for '{option}': '{value}' is not a directory.")
+    if not dir_okay and not resolved.is_file():
+        parser.error(f"Invalid value for '{option}': '{value}' is not a file.")
+    return resolved
+
+
+def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = _build_parser()
+    argv, exec_args = _split_exec_args(argv)
+    namespace = parser.parse_args(argv)
+
+    if namespace.version:
+        _show_version()
+
+    if namespace.command is None:
+        parser.error("Missing command.")
+
+    obj = _make_context(
+        _resolve_path_option(parser, "--file", namespace.file, dir_okay=False),
+        _resolve_path_option(parser, "--directory", namespace.directory, dir_okay=True),
+        namespace.verbosity,
+    )
 
-def _show_version(ctx: typer.Context, value: bool):
-    if value is False:
+    if namespace.command == "init":
+        init(obj)
+    else:
+        # NOTE: A leading '--' only separates bex options from the
+        #       forwarded arguments, it is not part of them.
+        args = exec_args or []
+        if args[:1] == ["--"]:
+            args = args[1:]
+        exec(obj, args)
+
+
+def _install_cancel_handlers(cancel: Callable[[], Any]) -> None:
+    import signal
+
+    # NOTE: os.set_blocking only works on Windows pipes from 3.12, and
+    #       signals are delivered on the main thread there anyway, so
+    #       plain handlers are enough.
+    if _IS_WINDOWS:
+        signal.signal(signal.SIGTERM, lambda _, __: cancel())
+        signal.signal(signal.SIGINT, lambda _, __: cancel())
         return
 
-    typer.echo(f"Python: {platform.python_version()} ({platform.system()})")
-    typer.echo(f"Bex: {__version__}")
-    ctx.exit(0)
-
-
-@app.callback(invoke_without_command=True)
-def callback(
-    ctx: typer.Context,
-    _: Annotated[
-        bool, typer.Option("--version", callback=_show_version, is_eager=True)
-    ] = False,
-    file: Annotated[
-        Path | None,
-        typer.Option(
-            "-f",
-            "--file",
-            exists=True,
-            file_okay=True,
-            dir_okay=False,
-            readable=True,
-            resolve_path=True,
-        ),
-    ] = None,
-    directory: Annotated[
-        Path | None,
-        typer.Option(
-            "-C",
-            "--directory",
-            exists=True,
-            file_okay=False,
-            dir_okay=True,
-            resolve_path=True,
-        ),
-    ] = None,
-    verbosity: Annotated[int, typer.Option("--verbose", "-v", count=True)] = 0,
-):
-    if ctx.invoked_subcommand is None:
-        ctx.fail("Missing command.")
+    import threading
+
+    # NOTE: The kernel writes the signal number straight to the wakeup
+    #       fd, so cancellation is not deferred until the interpreter
+    #       reaches the next bytecode boundary (which can take seconds
+    #       while blocked on a subprocess read).
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
+
+    def _watch() -> None:
+        while len(os.read(read_fd, 1)) > 0:
+            cancel()
+
+    threading.Thread(target=_watch, daemon=True).start()
+
+    # NOTE: Install no-op handlers so SIGINT does not raise
+    #       KeyboardInterrupt; the wakeup fd drives the cancel token.
+    signal.signal(signal.SIGTERM, lambda _, __: None)
+    signal.signal(signal.SIGINT, lambda _, __: None)
 
-    console = Console()
 
-    # Configure logging
+def _show_version() -> None:
+    import platform
+
+    print(f"Python: {platform.python_version()} ({platform.system()})")
+    print(f"Bex: {__version__}")
+    raise SystemExit(0)
+
+
+def _setup_logging(console: Console, verbosity: int) -> None:
+    import logging
+
     root_logger = logging.getLogger()
     root_logger.setLevel(
         {
@@ -111,29 +218,55 @@ def callback(
             2: logging.DEBUG,
         }.get(verbosity, logging.DEBUG)
     )
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-    handler = RichHandler(console=console, show_path=False, omit_repeated_times=False)
-    root_logger.addHandler(handler)
-
-    # Update context
-    ctx.ensure_object(dict)
-    ctx.obj["verbosity"] = verbosity
-    ctx.obj["console"] = console
-    ctx.obj["file"] = file
-    ctx.obj["directory"] = directory
-
-
-@app.command()
-def init(ctx: typer.Context):
-    console: Console = ctx.obj["console"]
-    token, cancel = with_cancel(default_token())
+    # NOTE: Keep handler installation idempotent so embedded or repeated
+    #       invocations do not rebuild a handler every time. Rich's
+    #       handler is only worth constructing on an actual terminal;
+    #       piped output (CI, log files) gets a plain StreamHandler.
+    global _LOGGING_CONFIGURED
+    if not _LOGGING_CONFIGURED:
+        root_logger.handlers.clear()
+        if console.is_terminal:
+            from rich.logging import RichHandler
+
+            handler = RichHandler(
+                console=console, show_path=False, omit_repeated_times=False
+            )
+        else:
+            handler = logging.StreamHandler()
+        root_logger.addHandler(handler)
+        _LOGGING_CONFIGURED = True
 
-    signal.signal(signal.SIGTERM, lambda _, __: cancel())
-    signal.signal(signal.SIGINT, lambda _, __: cancel())
 
+def _make_context(
+    file: Path | None, directory: Path | None, verbosity: int
+) -> dict[str, Any]:
+    # NOTE: Imported lazily so '--help' and '--version' do not pay the
+    #       rich import cost.
+    from rich.console import Console
+
+    console = Console()
+    _setup_logging(console, verbosity)
+
+    return {
+        "verbosity": verbosity,
+        "console": console,
+        "file": file,
+        "directory": directory,
+    }
+
+
+def init(obj: dict[str, Any]) -> None:
+    from bex.config import load_configuration
+
+    console: Console = obj["console"]
+    token, cancel = with_cancel(default_token())
+
+    # NOTE: Only install the signal plumbing once there is actually a
+    #       bootstrap to cancel; configuration errors exit before any
+    #       handler is touched.
     bootstrap_result = flow(
-        load_configuration(ctx.obj["directory"], ctx.obj["file"], ctx.obj["verbosity"]),
+        load_configuration(obj["directory"], obj["file"], obj["verbosity"]),
+        result.inspect(lambda _: _install_cancel_handlers(cancel)),
         result.map_(lambda val: (val,)),
         result.zipped(partial(_bootstrap, token, console)),
     )
@@ -141,48 +274,41 @@ def init(ctx: typer.Context):
     match bootstrap_result:
         case Ok(_):
             console.print("Environment bootstrapped successfully", style="green")
-            ctx.exit(0)
+            raise SystemExit(0)
         case Error(CancellationTokenCancelledError()):
             console.print("Process was cancelled", style="red")
-            ctx.exit(3)
+            raise SystemExit(3)
         case Error(BexPyVenvError() as err):
             console.print(
                 f"Error while creating virtual environment: {err.msg}", style="red"
             )
-            ctx.exit(1)
+            raise SystemExit(1)
         case Error(BexUvError() as err):
             console.print(f"Error while downloading uv: {err.msg}", style="red")
-            ctx.exit(1)
+            raise SystemExit(1)
         case Error(BexError() as err):
             console.print(err.msg, style="red")
-            ctx.exit(1)
+            raise SystemExit(1)
         case Error(err):
+            from rich.traceback import Traceback
+
             console.print("Failed to bootstrap environment", style="red")
             console.print(
                 Traceback(Traceback.extract(type(err), err, err.__traceback__)),
                 style="dim",
             )
-            ctx.exit(1)
+            raise SystemExit(1)
 
 
-@app.command(context_settings={"help_option_names": [], "ignore_unknown_options": True})
-def exec(
-    ctx: typer.Context,
-    args: Annotated[
-        list[str] | None,
-        typer.Argument(
-            help="Any arguments are forwarded to the entrypoint",
-        ),
-    ] = None,
-):
-    console: Console = ctx.obj["console"]
-    token, cancel = with_cancel(default_token())
+def exec(obj: dict[str, Any], args: list[str]) -> None:  # noqa: A001
+    from bex.config import load_configuration
 
-    signal.signal(signal.SIGTERM, lambda _, __: cancel())
-    signal.signal(signal.SIGINT, lambda _, __: cancel())
+    console: Console = obj["console"]
+    token, cancel = with_cancel(default_token())
 
     exec_result = flow(
-        load_configuration(ctx.obj["directory"], ctx.obj["file"], ctx.obj["verbosity"]),
+        load_configuration(obj["directory"], obj["file"], obj["verbosity"]),
+        result.inspect(lambda _: _install_cancel_handlers(cancel)),
         result.map_(lambda val: (val,)),
         result.zipped(partial(_bootstrap, token, console)),
         result.inspect(
@@ -190,194 +316,213 @@ def exec(
                 "Environment bootstrapped successfully", style="green"
             )
         ),
-        result.and_then(lambda val: _execute(*val, args or [])),
+        result.and_then(lambda val: _execute(*val, args)),
     )
 
     match exec_result:
         case Ok(retcode):
-            ctx.exit(retcode)
+            raise SystemExit(retcode)
         case Error(CancellationTokenCancelledError()):
             console.print("Process was cancelled", style="red")
-            ctx.exit(3)
+            raise SystemExit(3)
         case Error(BexPyVenvError() as err):
             console.print(
                 f"Error while creating virtual environment: {err.msg}", style="red"
             )
-            ctx.exit(1)
+            raise SystemExit(1)
         case Error(BexUvError() as err):
             console.print(f"Error while downloading uv: {err.msg}", style="red")
-            ctx.exit(1)
+            raise SystemExit(1)
         case Error(BexError() as err):
             console.print(err.msg, style="red")
-            ctx.exit(1)
+            raise SystemExit(1)
         case Error(err):
+            from rich.traceback import Traceback
+
             console.print("Failed to execute environment", style="red")
             console.print(
                 Traceback(Traceback.extract(type(err), err, err.__traceback__)),
                 style="dim",
             )
-            ctx.exit(1)
+            raise SystemExit(1)
+
+
+def _hash_file(path: Path) -> bytes:
+    import hashlib
+
+    # NOTE: The env hash is change detection, not a security boundary;
+    #       BLAKE2b is noticeably cheaper per byte than SHA-1.
+    with open(path, "rb") as fp:
+        # NOTE: For larger files, mmap lets the hash read straight from
+        #       the page cache with no Python-side buffer; below that
+        #       the mapping setup costs more than it saves.
+        if os.fstat(fp.fileno()).st_size > 65536:
+            import mmap
+
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.blake2b(mm, digest_size=16).digest()
+
+        return hashlib.file_digest(
+            fp, partial(hashlib.blake2b, digest_size=16)
+        ).digest()
+
+
+def _read_or_none(file: Path) -> bytes | None:
+    # NOTE: EAFP read instead of an exists() + read pair, one syscall
+    #       instead of two.
+    try:
+        return file.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _resolve_uv_bin(
+    console: Console,
+    cancel_token: CancellationToken,
+    working_dir: Path,
+    version: str | None,
+) -> Path:
+    uv_path_file = working_dir / "uv.path"
+
+    # NOTE: A successful bootstrap remembers which uv binary it used, so
+    #       later cache misses skip download_uv's version resolution
+    #       (one GitHub API round-trip when no version is pinned).
+    cached = _read_or_none(uv_path_file)
+    if cached is not None:
+        try:
+            cached_version, cached_bin = cached.decode("utf-8").splitlines()
+            if cached_version == (version or "") and Path(cached_bin).exists():
+                return Path(cached_bin)
+        except Exception:  # noqa: S110
+            pass
+
+    from bex.uv import download_uv
+
+    uv_bin = download_uv(
+        console, cancel_token, working_dir / "cache" / "uv", version=version
+    )
+    with contextlib.suppress(Exception):
+        uv_path_file.write_text(f"{version or ''}\n{uv_bin}")
+    return uv_bin
 
 
 def _bootstrap(
     cancel_token: CancellationToken, console: Console, config: Config
 ) -> Result[Path, Exception]:
+    import logging
+
     logger = logging.getLogger("bex.bootstrap")
 
-    # Get working directory
-    match flow(
-        result.try_(lambda: config["directory"] / ".bex"),
-        result.and_then(result.safe(lambda path: path.mkdir(exist_ok=True) or path)),
-    ):
-        case Ok(directory):
-            working_dir = directory
-        case Error(_) as err:
-            return result.error(err.error)
-
-    # Get current env hash
-    # TODO: Show warning if we failed to compute env hash
-    env_hash = flow(
-        result.try_(
-            lambda: hashlib.sha1(config["filename"].read_bytes()).hexdigest()  # noqa: S324
-        ),
-        result.unwrap_or(""),
-    )
+    # NOTE: Straight-line try/except instead of combinator pipelines,
+    #       this runs on every startup and the closure/Result
+    #       allocations per stage were pure overhead.
+    try:
+        # Get working directory
+        working_dir = config["directory"] / ".bex"
+        working_dir.mkdir(exist_ok=True)
+
+        python_bin = (working_dir / ".venv").joinpath(*_PY_VENV_BIN)
+        env_hash_file = working_dir / ".envhash"
+        env_stat_file = working_dir / ".envhash.stat"
+
+        # Get current env stat
+        # NOTE: Hashing the config file on every run is wasted work when
+        #       it has not been touched; a (mtime, size) memo lets us
+        #       trust the stored hash without re-reading the file.
+        try:
+            st = config["filename"].stat()
+            env_stat = f"{st.st_mtime_ns}:{st.st_size}"
+        except Exception:
+            env_stat = ""
+
+        if len(env_stat) > 0 and _read_or_none(env_stat_file) == env_stat.encode(
+            "utf-8"
+        ):
+            return result.ok(python_bin)
 
-    # Get env hash file
-    match result.try_(lambda: working_dir / ".envhash"):
-        case Ok(file):
-            env_hash_file = file
-        case Error(_) as err:
-            return result.error(err.error)
-
-    # Check if env has changed
-    match result.try_(
-        lambda: env_hash_file.exists() and env_hash == env_hash_file.read_text()
-    ):
-        case Ok(hash_matched) if hash_matched is True:
-            return result.try_(
-                lambda: (
-                    working_dir
-                    / ".venv"
-                    / ("Scripts" if sys.platform == "win32" else "bin")
-                    / ("python.exe" if sys.platform == "win32" else "python")
-                )
-            )
-        case Error(_) as err:
-            return result.error(err.error)
-
-    # Create / Sync python virtual environment
-    match flow(
-        result.try_(lambda: working_dir / "cache" / "uv"),
-        result.and_then(
-            result.safe(
-                partial(
-                    download_uv, console, cancel_token, version=config["uv_version"]
-                )
-            )
-        ),
-        result.inspect(lambda _: logger.info("Downloaded UV")),
-        result.and_then(
-            result.safe(
-                lambda uv_bin: _create_isolated_environment(
-                    console,
-                    cancel_token,
-                    working_dir,
-                    uv_bin,
-                    config["requires_python"],
-                    config["requirements"],
-                )
-            )
-        ),
-    ):
-        case Ok(python_bin):
-            # NOTE: If this fail, we don't want the entire program to crash
-            #       instead, we could just show a warning message
-            _ = result.try_(env_hash_file.write_text, env_hash)
+        # Get current env hash
+        # TODO: Show warning if we failed to compute env hash
+        try:
+            env_hash = _hash_file(config["filename"])
+        except Exception:
+            env_hash = b""
+
+        def _write_env_state() -> None:
+            for file, data in (
+                (env_hash_file, env_hash),
+                (env_stat_file, env_stat.encode("utf-8")),
+            ):
+                tmp = file.with_name(file.name + ".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, file)
+
+        # Check if env has changed
+        # NOTE: A pre-BLAKE2b '.envhash' (SHA-1 hex) can never match,
+        #       so old environments rebuild once and rewrite both state
+        #       files in the new format.
+        if _read_or_none(env_hash_file) == env_hash:
+            # NOTE: If this fail, we don't want the entire program to
+            #       crash instead, we could just show a warning message
+            with contextlib.suppress(Exception):
+                _write_env_state()
             return result.ok(python_bin)
-        case Error(_) as err:
-            return result.error(err.error)
+
+        # Create / Sync python virtual environment
+        uv_bin = _resolve_uv_bin(
+            console, cancel_token, working_dir, config["uv_version"]
+        )
+        logger.info("Downloaded UV")
+
+        python_bin = _create_isolated_environment(
+            console,
+            cancel_token,
+            working_dir,
+            uv_bin,
+            config["requires_python"],
+            config["requirements"],
+        )
+
+        # NOTE: If this fail, we don't want the entire program to crash
+        #       instead, we could just show a warning message
+        with contextlib.suppress(Exception):
+            _write_env_state()
+        return result.ok(python_bin)
+    except Exception as err:
+        return result.error(err)
 
 
 def _execute(
     config: Config, python_bin: Path, extra_args: list[str]
 ) -> Result[int, Exception]:
-    # NOTE: Convert entrypoint to python CLI options
-    #       either "-m <module_name>" or to "-c <script>" with a script
-    #       that imports module and execute function.
-    match flow(
-        result.try_(_ENTRYPOINT_PATTERN.match, config["entrypoint"]),
-        result.and_then(
-            lambda match: (
-                result.ok(match)
-                if match is not None
-                else result.error(
-                    BexError(
-                        f"Invalid plugin entrypoint format '{config['entrypoint']}'"
-                    )
-                )
-            )
-        ),
-        result.and_then(
-            result.safe(
-                lambda match_: (
-                    ["-m", str(match_.group("module"))]
-                    if len(
-                        attrs := list(
-                            filter(None, (match_.group("attr") or "").split("."))
-                        )
-                    )
-                    == 0
-                    else [
-                        "-c",
-                        "import {} as _entrypoint;_entrypoint.{}()".format(
-                            match_.group("module"), ".".join(attrs)
-                        ),
-                    ]
-                )
-            )
-        ),
-    ):
-        case Ok(opts_):
-            opts = opts_
-        case Error(_) as err:
-            return result.error(
-                BexError("Failed to convert entrypoint to python CLI options")
-            )
-
-    match result.collect(
-        result.try_(
-            lambda: {
-                **os.environ,
-                "BEX_FILE": str(config["filename"]),
-                "BEX_DIRECTORY": str(config["directory"]),
-                "BEX_VERBOSITY": str(config["verbosity"]),
-            }
-        ),
-        result.try_(
-            lambda: [
-                str(python_bin),
-                *opts,
-                *extra_args,
-            ]
-        ),
-    ):
-        case Ok((env, args)):
-            if sys.platform == "win32":
-                return result.try_(
-                    subprocess.call,
+    try:
+        # NOTE: Mutate os.environ in place so the child inherits through
+        #       the C-level environ instead of a full dict copy built
+        #       just to add three keys; we exec (or exit) right after.
+        os.environ["BEX_FILE"] = str(config["filename"])
+        os.environ["BEX_DIRECTORY"] = str(config["directory"])
+        os.environ["BEX_VERBOSITY"] = str(config["verbosity"])
+
+        # NOTE: The entrypoint was already converted to CLI options at
+        #       config-load time.
+        args = [str(python_bin), *config["exec_opts"], *extra_args]
+
+        if _IS_WINDOWS:
+            import subprocess
+
+            return result.ok(
+                subprocess.call(
                     args,
-                    env=env,
                     stdin=sys.stdin,
                     stdout=sys.stdout,
                     stderr=sys.stderr,
                     shell=False,
                 )
+            )
 
-            # NOTE: Must be careful what process is executed here
-            return result.ok(os.execve(python_bin, args, env))  # noqa: S606
-        case Error(_) as err:
-            return result.error(err.error)
+        # NOTE: Must be careful what process is executed here
+        return result.ok(os.execv(python_bin, args))  # noqa: S606
+    except Exception as err:
+        return result.error(err)
 
 
 def _create_isolated_environment(
@@ -388,16 +533,15 @@ def _create_isolated_environment(
     python_specifier: str,
     requirements: str,
 ):
+    import logging
+
+    from bex.utils import wait_process
+
     logger = logging.getLogger("bex.bootstrap")
 
     venv_dir = root_dir / ".venv"
     requirements_in = root_dir / "requirements.in"
-    requirements_txt = root_dir / "requirements.txt"
-    python_bin = (
-        venv_dir
-        / ("Scripts" if platform.system() == "Windows" else "bin")
-        / ("python.exe" if platform.system() == "Windows" else "python")
-    )
+    python_bin = venv_dir.joinpath(*_PY_VENV_BIN)
 
     with console.status("[not dim]Bootstrapping environment[/not dim]"):
         create_venv_rc = wait_process(
@@ -422,37 +566,26 @@ def _create_isolated_environment(
 
         logger.info("Updated virtual environment")
 
-        requirements_in.write_bytes(requirements.encode("utf-8"))
-        lock_pip_requirements_rc = wait_process(
-            [
-                str(uv_bin),
-                "pip",
-                "compile",
-                "--python",
-                str(python_bin),
-                "--emit-index-url",
-                str(requirements_in),
-                "-o",
-                str(requirements_txt),
-            ],
-            cancel_token,
-            callback=logger.debug,
-        )
-        if lock_pip_requirements_rc != 0:
-            msg = "Failed to compile pip requirements"
-            raise BexPyVenvError(msg)
-
-        logger.info("Locked dependencies")
+        # NOTE: Only rewrite requirements.in when its content actually
+        #       changed, an unconditional write busts the file mtime and
+        #       with it uv's own caching heuristics.
+        requirements_data = requirements.encode("utf-8")
+        if _read_or_none(requirements_in) != requirements_data:
+            requirements_in.write_bytes(requirements_data)
 
+        # NOTE: 'uv pip install --exact' resolves and syncs in a single
+        #       process, so there is no need to lock to an intermediate
+        #       requirements.txt first.
         sync_pip_requirements_rc = wait_process(
             [
                 str(uv_bin),
                 "pip",
-                "sync",
-                "--allow-empty-requirements",
+                "install",
+                "--exact",
                 "--python",
                 str(python_bin),
-                str(requirements_txt),
+                "-r",
+                str(requirements_in),
             ],
             cancel_token,
             callback=logger.debug,
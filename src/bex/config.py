@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import glob
+import functools
+import io
+import os
 import re
-from functools import partial
+import tomllib
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypedDict, cast
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from ruamel.yaml import YAML
-from stdlibx import option, result
-from stdlibx.compose import flow
+from stdlibx import result
+from stdlibx.result.types import Error, Ok
 
 from bex.errors import BexError
 
@@ -19,6 +21,26 @@ if TYPE_CHECKING:
 _INLINE_METADATA_REGEX = (
     r"(?m)^# /// (?P<type>[a-zA-Z0-9-]+)$\s(?P<content>(^#(| .*)$\s)+)^# ///$"
 )
+# NOTE: Compiled over bytes so the scan never decodes the script body,
+#       only the matched block content is decoded before parsing.
+_INLINE_METADATA_RE = re.compile(_INLINE_METADATA_REGEX.encode())
+
+_SCAN_CHUNK_SIZE = io.DEFAULT_BUFFER_SIZE * 2
+
+# NOTE: Constructing a YAML instance builds the full resolver graph,
+#       share a single safe loader across parses instead.
+_YAML = YAML(typ="safe")
+
+_STRIP_COMMENT_RE = re.compile(r"(?m)^# ?")
+
+# NOTE: Entrypoints are python identifiers, re.ASCII keeps \w away
+#       from the unicode tables.
+_ENTRYPOINT_PATTERN = re.compile(
+    r"(?P<module>[\w.]+)\s*"
+    r"(:\s*(?P<attr>[\w.]+)\s*)?"
+    r"((?P<extras>\[.*\])\s*)?",
+    re.ASCII,
+)
 
 
 class Config(TypedDict):
@@ -30,81 +52,101 @@ class Config(TypedDict):
     requires_python: str
     requirements: str
     entrypoint: str
+    exec_opts: list[str]
 
 
 def load_configuration(
     directory: Path | None, filename: Path | None, verbosity: int
 ) -> Result[Config, Exception]:
-    _directory = flow(
-        option.maybe(lambda: directory),
-        option.map_or_else(lambda: result.try_(Path.cwd), lambda val: result.ok(val)),
-    )
-
-    _file = flow(
-        option.maybe(lambda: filename),
-        option.map_or_else(
-            lambda: flow(
-                _directory,
-                result.and_then(
-                    result.safe(
-                        lambda directory: (
-                            directory / next(glob.iglob("bex.*", root_dir=directory))
-                        )
-                    )
-                ),
-                result.map_err(
-                    lambda err: (
-                        BexError("Could not find bex file")
-                        if isinstance(err, StopIteration)
-                        else err
-                    )
-                ),
-            ),
-            lambda val: result.ok(val),
-        ),
-    )
-
-    return flow(
-        result.collect(_directory, _file),
-        result.and_then(
-            lambda val: _parse_config(
-                val[0], val[1], verbosity, labels=["bootstrap", "bex"]
+    try:
+        _directory = directory if directory is not None else Path.cwd()
+        _file = filename if filename is not None else _find_bex_file(_directory)
+    except Exception as err:  # noqa: BLE001
+        return result.error(err)
+
+    return _parse_config(_directory, _file, verbosity, labels=["bootstrap", "bex"])
+
+
+def _find_bex_file(directory: Path) -> Path:
+    # NOTE: The lookup is a fixed prefix on a single directory, one
+    #       scandir pass is enough, no need for the glob machinery.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("bex.") and entry.is_file():
+                return directory / entry.name
+
+    raise BexError("Could not find bex file")
+
+
+def _carry_start(buffer: bytes) -> int:
+    # NOTE: A metadata block is a run of consecutive '#' lines, so any
+    #       trailing comment run (plus a possibly incomplete last line)
+    #       may still be extended by the next chunk and must be carried
+    #       over; everything before it is safe to scan.
+    last_nl = buffer.rfind(b"\n")
+    if last_nl < 0:
+        return 0
+
+    carry = last_nl + 1
+    while carry > 0:
+        prev_nl = buffer.rfind(b"\n", 0, carry - 1)
+        line_start = prev_nl + 1
+        if not buffer.startswith(b"#", line_start):
+            break
+        carry = line_start
+    return carry
+
+
+def _scan_metadata_blocks(file: Path, labels: list[bytes]) -> list[re.Match[bytes]]:
+    # NOTE: Scan the file in bounded chunks instead of loading it whole,
+    #       the metadata block usually sits at the top while the rest of
+    #       the script can be arbitrarily large.
+    matches: list[re.Match[bytes]] = []
+    buffer = b""
+    with open(file, "rb") as fp:
+        while True:
+            chunk = fp.read(_SCAN_CHUNK_SIZE)
+            if len(chunk) == 0:
+                region, buffer = buffer, b""
+            else:
+                buffer += chunk
+                carry = _carry_start(buffer)
+                region, buffer = buffer[:carry], buffer[carry:]
+
+            # NOTE: read_text() translated universal newlines before the
+            #       move to bytes, match that so CRLF/CR-saved files
+            #       still parse. Regions always end on a line boundary,
+            #       so a CRLF pair is never split across two regions.
+            region = region.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+            matches.extend(
+                match
+                for match in _INLINE_METADATA_RE.finditer(region)
+                if match.group("type") in labels
             )
-        ),
-    )
+            if len(chunk) == 0:
+                return matches
 
 
 def _parse_config(
     directory: Path, file: Path, verbosity: int, /, *, labels: list[str]
 ) -> Result[Config, Exception]:
-    return flow(
-        result.try_(lambda: re.finditer(_INLINE_METADATA_REGEX, file.read_text())),
-        result.and_then(
-            result.safe(
-                lambda iterator: (m for m in iterator if m.group("type") in labels)
-            )
-        ),
-        result.and_then(result.safe(list)),
-        result.and_then(
-            lambda matches: cast(
-                "Result[list[re.Match[str]], Exception]",
-                (
-                    result.ok(matches)
-                    if len(matches) == 1
-                    else result.error(ValueError("Multiple blocks found"))
-                ),
-            )
-        ),
-        result.and_then(
-            lambda matches: (
-                _parse_inline_metadata(matches[0].group("content"))
-                if len(matches) == 1
-                else result.ok({})
-            )
-        ),
-        result.and_then(result.safe(_validate_config)),
-        result.map_(
-            lambda config: Config(
+    # NOTE: Straight-line try/except, the combinator pipeline allocated
+    #       a Result and several closures per stage on every config
+    #       load; only the boundary keeps the Result type.
+    try:
+        matches = _scan_metadata_blocks(file, [label.encode() for label in labels])
+        if len(matches) != 1:
+            return result.error(ValueError("Multiple blocks found"))
+
+        match _parse_inline_metadata(matches[0].group("content").decode("utf-8")):
+            case Ok(parsed):
+                config = _validate_config(parsed)
+            case Error(_) as failure:
+                return failure
+
+        return result.ok(
+            Config(
                 {
                     "directory": directory,
                     "filename": file,
@@ -113,8 +155,35 @@ def _parse_config(
                     "requires_python": config["requires-python"],
                     "requirements": config.get("requirements", ""),
                     "entrypoint": config["entrypoint"],
+                    # NOTE: Partial-evaluated here so 'bex exec'
+                    #       splices a ready-made argv instead of
+                    #       re-parsing the entrypoint on every run.
+                    "exec_opts": list(_parse_entrypoint(config["entrypoint"])),
                 }
             )
+        )
+    except Exception as err:  # noqa: BLE001
+        return result.error(err)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_entrypoint(entrypoint: str) -> tuple[str, ...]:
+    # NOTE: Convert entrypoint to python CLI options
+    #       either "-m <module_name>" or to "-c <script>" with a script
+    #       that imports module and execute function.
+    match_ = _ENTRYPOINT_PATTERN.fullmatch(entrypoint.strip())
+    if match_ is None:
+        msg = f"Invalid plugin entrypoint format '{entrypoint}'"
+        raise BexError(msg)
+
+    attrs = list(filter(None, (match_.group("attr") or "").split(".")))
+    if len(attrs) == 0:
+        return ("-m", str(match_.group("module")))
+
+    return (
+        "-c",
+        "import {} as _entrypoint;_entrypoint.{}()".format(
+            match_.group("module"), ".".join(attrs)
         ),
     )
 
@@ -129,18 +198,13 @@ def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
 
 
 def _parse_inline_metadata(content: str) -> Result[dict[str, Any], Exception]:
-    return flow(
-        result.ok(content),
-        result.and_then(
-            result.safe(partial(str.splitlines, keepends=True)),
-        ),
-        result.and_then(
-            result.safe(
-                lambda lines: (
-                    line[2:] if line.startswith("# ") else line[1:] for line in lines
-                )
-            )
-        ),
-        result.and_then(result.safe("".join)),
-        result.and_then(result.safe(YAML(typ="safe").load)),
-    )
+    # NOTE: A single substitution runs inside the regex engine instead
+    #       of splitting, slicing and re-joining every line in Python.
+    stripped = _STRIP_COMMENT_RE.sub("", content)
+
+    # NOTE: PEP 723 blocks are TOML, try the stdlib C parser first and
+    #       keep the much slower YAML loader as legacy fallback.
+    try:
+        return result.ok(tomllib.loads(stripped))
+    except tomllib.TOMLDecodeError:
+        return result.try_(_YAML.load, stripped)